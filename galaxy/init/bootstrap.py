@@ -10,8 +10,9 @@ def get_api_key(gi):
     api_key = -1
 
     print("Checking for existing user")
-    print(gi.users.get_users())
-    for existing_user in gi.users.get_users():
+    users = gi.users.get_users()
+    print(users)
+    for existing_user in users:
         if (existing_user['email'] == "admin@example.org" or
             existing_user['username'] == "admin"):
             api_key = gi.users.get_or_create_user_apikey(existing_user['id'])
@@ -38,11 +39,12 @@ def get_workflow_name(workflow_file):
         workflow_name = workflow['name']
     return workflow_name
 
-def check_worfklow_imported(gi, workflow_name, workflows):
-    if any(workflow_name in w['name'] for w in workflows):
-        print(f"Workflow {workflow_name} already imported")
-        return True
-    return False
+def find_imported_workflow(workflow_name, workflows):
+    for workflow in workflows:
+        if workflow['name'] == workflow_name:
+            print(f"Workflow {workflow_name} already imported")
+            return workflow
+    return None
 
 def add_workflows():
 
@@ -59,7 +61,6 @@ def add_workflows():
     api_key = get_api_key(gi)
     gi = GalaxyInstance(url=os.environ['GALAXY_URL'], key=api_key)
     print(gi.users.get_current_user())
-    user_id = gi.users.get_current_user()['id']
 
     # --------------------------------------------------------------------------
     # Import workflows if not already imported
@@ -67,35 +68,36 @@ def add_workflows():
     # Get current workflows
     workflows = gi.workflows.get_workflows()
 
-    # Loop through workflow files
-    for workflow_file in os.listdir(tool_path):
-        workflow_name = get_workflow_name(workflow_file)
+    # Share one HTTP connection across the link-access requests below
+    with requests.Session() as session:
+        # Loop through workflow files
+        for workflow_file in os.listdir(tool_path):
+            workflow_name = get_workflow_name(workflow_file)
 
-        # ----------------------------------------------------------------------
-        # Import the workflow
+            # ------------------------------------------------------------------
+            # Import the workflow
 
-        if check_worfklow_imported(gi, workflow_name, workflows) == False:
-            workflow = gi.workflows.import_workflow_from_local_path(f"{tool_path}/{workflow_file}")
-            print(f"Imported workflow {json.dumps(workflow)}")
-        else:
-            workflow = gi.workflows.get_workflows(name=workflow_name)[0]
+            workflow = find_imported_workflow(workflow_name, workflows)
+            if workflow is None:
+                workflow = gi.workflows.import_workflow_from_local_path(f"{tool_path}/{workflow_file}")
+                print(f"Imported workflow {json.dumps(workflow)}")
 
-        # ----------------------------------------------------------------------
-        # Publish the workflow and add it to the menu
+            # ------------------------------------------------------------------
+            # Publish the workflow and add it to the menu
 
-        workflow_id = workflow['id']
-        result = gi.workflows.update_workflow(workflow_id,
-                                              published=True,
-                                              menu_entry=True)
-        print(f"Published workflow with result {json.dumps(result)}")
+            workflow_id = workflow['id']
+            result = gi.workflows.update_workflow(workflow_id,
+                                                  published=True,
+                                                  menu_entry=True)
+            print(f"Published workflow with result {json.dumps(result)}")
 
-        # ----------------------------------------------------------------------
-        # Share with all users
+            # ------------------------------------------------------------------
+            # Share with all users
 
-        endpoint = f"{os.environ['GALAXY_URL']}/api/workflows/{workflow_id}/enable_link_access"
-        params = {"key": api_key}
-        response = requests.put(f"{endpoint}", params=params)
-        print(json.dumps(response.json()))
+            endpoint = f"{os.environ['GALAXY_URL']}/api/workflows/{workflow_id}/enable_link_access"
+            params = {"key": api_key}
+            response = session.put(f"{endpoint}", params=params)
+            print(response.text)
 
 
 if __name__ == "__main__":